@@ -6,18 +6,18 @@ config files to eliminate type inference warnings in BIRD 2.17+.
 """
 
 import argparse
+import functools
 import ipaddress
 import locale
 import os
 import re
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, List, NamedTuple, Optional, Union
 
 
-@dataclass
-class LanguageConfig:
+class LanguageConfig(NamedTuple):
     lang: str
     usage_title: str
     usage_method: str
@@ -34,261 +34,357 @@ class LanguageConfig:
     no_conf_files: str
 
 
-class LanguageManager:
-    def __init__(self):
-        self._current_lang = self._detect_language()
-        self._configs = {
-            "zh": LanguageConfig(
-                lang="zh",
-                usage_title="BIRD2 Auto Type Completion",
-                usage_method="用法",
-                basic_examples="示例",
-                options="选项",
-                detailed_help="详细帮助: python3 main.py --help",
-                detailed_examples="详细示例",
-                supported_types="支持类型",
-                note="注: 无返回值函数将保持不变",
-                error_missing_args="错误: 缺少参数",
-                error_path_not_exists="错误: 路径 '{}' 不存在",
-                error_processing="处理错误: {}",
-                success_processed="完成: {}",
-                no_conf_files="目录 {} 中无 .conf 文件",
-            ),
-            "en": LanguageConfig(
-                lang="en",
-                usage_title="BIRD2 Auto Type Completion",
-                usage_method="Usage",
-                basic_examples="Examples",
-                options="Options",
-                detailed_help="For help: python3 main.py --help",
-                detailed_examples="Detailed examples",
-                supported_types="Supported types",
-                note="Note: Void functions remain unchanged",
-                error_missing_args="Error: Missing arguments",
-                error_path_not_exists="Error: Path '{}' not found",
-                error_processing="Error: {}",
-                success_processed="Done: {}",
-                no_conf_files="No .conf files in {}",
-            ),
-        }
+# 各语言的界面文本，仅在使用时构造对应的 LanguageConfig
+_LANGUAGE_STRINGS = {
+    "zh": dict(
+        lang="zh",
+        usage_title="BIRD2 Auto Type Completion",
+        usage_method="用法",
+        basic_examples="示例",
+        options="选项",
+        detailed_help="详细帮助: python3 main.py --help",
+        detailed_examples="详细示例",
+        supported_types="支持类型",
+        note="注: 无返回值函数将保持不变",
+        error_missing_args="错误: 缺少参数",
+        error_path_not_exists="错误: 路径 '{}' 不存在",
+        error_processing="处理错误: {}",
+        success_processed="完成: {}",
+        no_conf_files="目录 {} 中无 .conf 文件",
+    ),
+    "en": dict(
+        lang="en",
+        usage_title="BIRD2 Auto Type Completion",
+        usage_method="Usage",
+        basic_examples="Examples",
+        options="Options",
+        detailed_help="For help: python3 main.py --help",
+        detailed_examples="Detailed examples",
+        supported_types="Supported types",
+        note="Note: Void functions remain unchanged",
+        error_missing_args="Error: Missing arguments",
+        error_path_not_exists="Error: Path '{}' not found",
+        error_processing="Error: {}",
+        success_processed="Done: {}",
+        no_conf_files="No .conf files in {}",
+    ),
+}
+
+
+# 语言只取决于启动时的环境，检测一次即可
+@functools.cache
+def _detect_language() -> str:
+    for var in ("LANG", "LC_ALL", "LC_MESSAGES"):
+        value = os.environ.get(var, "").lower()
+        if "zh" in value or "cn" in value:
+            return "zh"
 
-    def _detect_language(self) -> str:
-        for var in ["LANG", "LC_ALL", "LC_MESSAGES"]:
-            value = os.environ.get(var, "").lower()
-            if "zh" in value or "cn" in value:
-                return "zh"
+    try:
+        default_locale = locale.getlocale()[0]
+        if default_locale and (
+            "zh" in default_locale.lower() or "cn" in default_locale.lower()
+        ):
+            return "zh"
+    except:
+        pass
+
+    return "en"
 
-        try:
-            default_locale = locale.getlocale()[0]
-            if default_locale and (
-                "zh" in default_locale.lower() or "cn" in default_locale.lower()
-            ):
-                return "zh"
-        except:
-            pass
 
-        return "en"
+class LanguageManager:
+    def __init__(self):
+        self._current_lang = _detect_language()
 
-    @property
+    @functools.cached_property
     def config(self) -> LanguageConfig:
-        return self._configs[self._current_lang]
+        return LanguageConfig(**_LANGUAGE_STRINGS[self._current_lang])
+
+
+INT_RE = re.compile(r"^\s*-?\d+\s*$")
+PAIR_RE = re.compile(r"^\s*\([^,)]+,\s*[^,)]+\)\s*$")
+SET_RE = re.compile(r"^\s*\{[^}]*\}\s*$")
+PREFIX_MASK_RE = re.compile(r"^(net(\.mask\(\d+\))?|.*\.mask\(\d+\))$")
+STRING_LITERAL_RE = re.compile(r'["\'][^"\'\n]*["\']')
+_V4_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+_V6_RE = re.compile(r"^[0-9a-fA-F:.]+$")
+# 比较、逻辑与匹配运算符：=, !=, <, >, <=, >=, &&, ||, !, ~, !~
+_BOOL_OP_RE = re.compile(r"[=<>!~]|&&|\|\|")
+
+# 每个候选类型对应的位，由 _classify 计算
+INT_BIT = 1
+PAIR_BIT = 2
+IP_BIT = 4
+PREFIX_BIT = 8
+STRING_BIT = 16
+SET_BIT = 32
+BOOL_BIT = 64
+ALL_TYPE_BITS = 0x7F
+
+
+def _is_valid_ip(value: str) -> bool:
+    # 先用正则粗筛，明显不是地址的值无需进入 ipaddress 模块
+    if not (_V4_RE.match(value) or (":" in value and _V6_RE.match(value))):
+        return False
+    try:
+        ipaddress.ip_address(value)
+        return True
+    except ValueError:
+        return False
 
 
-class BirdTypeInferencer:
-    TYPE_PATTERNS = [
-        ("int", lambda v: re.match(r"^\s*-?\d+\s*$", v.strip())),
-        ("pair", lambda v: re.match(r"^\s*\([^,)]+,\s*[^,)]+\)\s*$", v.strip())),
-        ("ip", lambda v: BirdTypeInferencer._is_ip_address(v.strip())),
-        ("prefix", lambda v: BirdTypeInferencer._is_prefix_type(v.strip())),
-        ("string", lambda v: BirdTypeInferencer._is_string_type(v.strip())),
-        ("set", lambda v: re.match(r"^\s*\{[^}]*\}\s*$", v.strip())),
-        ("bool", lambda v: BirdTypeInferencer._is_bool_type(v.strip())),
-    ]
+# 配置中同样的返回值会反复出现，缓存依赖 ipaddress 的检查结果
+@functools.lru_cache(maxsize=2048)
+def _is_ip_address(value: str) -> bool:
+    if "/" in value:
+        return False
+
+    # 处理 .mask() 函数的情况，例如 1.2.3.4.mask(8)
+    if ".mask(" in value:
+        # 提取 .mask() 之前的部分
+        base_ip = value.split(".mask(")[0]
+        return _is_valid_ip(base_ip)
 
-    @staticmethod
-    def _is_ip_address(value: str) -> bool:
-        if "/" in value:
-            return False
-
-        # 处理 .mask() 函数的情况，例如 1.2.3.4.mask(8)
-        if ".mask(" in value:
-            # 提取 .mask() 之前的部分
-            base_ip = value.split(".mask(")[0]
-            try:
-                ipaddress.ip_address(base_ip)
-                return True
-            except ValueError:
-                return False
+    return _is_valid_ip(value)
 
+
+@functools.lru_cache(maxsize=2048)
+def _is_prefix_type(value: str) -> bool:
+    if "/" in value and _is_valid_ip(value.partition("/")[0]):
         try:
-            ipaddress.ip_address(value)
+            ipaddress.ip_network(value, strict=False)
             return True
         except ValueError:
-            return False
-
-    @staticmethod
-    def _is_prefix_type(value: str) -> bool:
-        if "/" in value:
-            try:
-                ipaddress.ip_network(value, strict=False)
-                return True
-            except ValueError:
-                pass
-
-        # 处理 .mask() 的情况
-        if ".mask(" in value:
-            # 如果 .mask() 之前的部分是有效的IP地址，则这是IP类型，不是前缀
-            base_part = value.split(".mask(")[0]
-            try:
-                ipaddress.ip_address(base_part)
-                return False  # 这是IP地址的掩码操作，不是前缀
-            except ValueError:
-                # 如果不是有效IP，检查是否是 net.mask() 这种前缀操作
-                return base_part == "net" or base_part.startswith("net.")
-
-        return bool(re.match(r"^(net(\.mask\(\d+\))?|.*\.mask\(\d+\))$", value))
-
-    @staticmethod
-    def _is_string_type(value: str) -> bool:
-        if re.search(r'["\'][^"\'\n]*["\']', value):
-            return True
-        return "," in value and not value.startswith(("(", "{"))
+            pass
 
-    @staticmethod
-    def _is_bool_type(value: str) -> bool:
-        if value in ["true", "false"]:
-            return True
-        operators = ["=", "!=", "<", ">", "<=", ">=", "&&", "||", "!", "~", "!~"]
-        return any(op in value for op in operators)
+    # 处理 .mask() 的情况
+    if ".mask(" in value:
+        # 如果 .mask() 之前的部分是有效的IP地址，则这是IP类型，不是前缀
+        base_part = value.split(".mask(")[0]
+        if _is_valid_ip(base_part):
+            return False  # 这是IP地址的掩码操作，不是前缀
+        # 如果不是有效IP，检查是否是 net.mask() 这种前缀操作
+        return base_part == "net" or base_part.startswith("net.")
+
+    return PREFIX_MASK_RE.match(value) is not None
+
+
+def _is_string_type(value: str) -> bool:
+    if STRING_LITERAL_RE.search(value):
+        return True
+    return "," in value and not value.startswith(("(", "{"))
+
+
+def _is_bool_type(value: str) -> bool:
+    if value in ("true", "false"):
+        return True
+    return _BOOL_OP_RE.search(value) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify(value: str) -> int:
+    """Return the bitmask of every type the value can be read as."""
+    value = value.strip()
+
+    # 按开销从低到高检查；整数字面量不会匹配其他任何类型
+    if INT_RE.match(value):
+        return INT_BIT
+
+    mask = 0
+    if value.startswith("(") and PAIR_RE.match(value):
+        mask |= PAIR_BIT
+    if value.startswith("{") and SET_RE.match(value):
+        mask |= SET_BIT
+    if _is_bool_type(value):
+        mask |= BOOL_BIT
+    if _is_string_type(value):
+        mask |= STRING_BIT
+    # ip 与 prefix 互斥，且都可能用到 ipaddress，放在最后
+    if _is_ip_address(value):
+        mask |= IP_BIT
+    elif _is_prefix_type(value):
+        mask |= PREFIX_BIT
+
+    return mask
+
+
+class BirdTypeInferencer:
+    # Ordered by priority: the first type matched by every return value wins.
+    # This order is documented in the README and decides overlapping values
+    # such as '"a" = b', so it is not the order checks run in (see _classify).
+    TYPE_PATTERNS = [
+        ("int", INT_BIT),
+        ("pair", PAIR_BIT),
+        ("ip", IP_BIT),
+        ("prefix", PREFIX_BIT),
+        ("string", STRING_BIT),
+        ("set", SET_BIT),
+        ("bool", BOOL_BIT),
+    ]
 
     def infer_return_type(self, return_values: List[str]) -> Optional[str]:
         if not return_values:
             return None
 
-        for type_name, checker in self.TYPE_PATTERNS:
-            if all(checker(val) for val in return_values):
+        mask = ALL_TYPE_BITS
+        for value in return_values:
+            mask &= _classify(value)
+            # 已没有所有返回值共有的类型，其余值无需再分类
+            if not mask:
+                break
+
+        for type_name, bit in self.TYPE_PATTERNS:
+            if mask & bit:
                 return f"{type_name} (int, int)" if type_name == "pair" else type_name
 
         return "bool"
 
     # Compatibility methods for existing tests
     def _is_int(self, value: str) -> bool:
-        return self.TYPE_PATTERNS[0][1](value) is not None
+        return INT_RE.match(value.strip()) is not None
 
     def _is_pair(self, value: str) -> bool:
-        return self.TYPE_PATTERNS[1][1](value) is not None
+        return PAIR_RE.match(value.strip()) is not None
 
     def _is_ip(self, value: str) -> bool:
-        return BirdTypeInferencer._is_ip_address(value)
+        return _is_ip_address(value)
 
     def _is_prefix(self, value: str) -> bool:
-        return BirdTypeInferencer._is_prefix_type(value)
+        return _is_prefix_type(value)
 
     def _is_string(self, value: str) -> bool:
-        return BirdTypeInferencer._is_string_type(value)
+        return _is_string_type(value)
 
     def _is_set(self, value: str) -> bool:
-        return self.TYPE_PATTERNS[5][1](value) is not None
+        return SET_RE.match(value.strip()) is not None
 
     def _is_bool(self, value: str) -> bool:
-        return BirdTypeInferencer._is_bool_type(value)
+        return _is_bool_type(value)
+
+
+# 单次扫描所需的记号：函数头（连同同一行的 {）、花括号，
+# 以及需要整体跳过的字符串和注释
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<header>^[ \t]*function\s+\w+[^{}\n\#"']*)(?P<open>\{)?
+    | [{}]
+    | "(?:[^"\\]|\\.)*"
+    | '[^']*'
+    | \#[^\n]*
+    | /\*.*?\*/
+    """,
+    re.MULTILINE | re.DOTALL | re.VERBOSE,
+)
 
 
 class BirdConfigProcessor:
-    FUNCTION_START = re.compile(r"^\s*function\s+\w+")
-    RETURN_PATTERN = re.compile(r"return\s+([^;]+);", re.MULTILINE)
+    # 捕获组不含首尾空白，内部只需合并连续或非空格的空白
+    RETURN_PATTERN = re.compile(r"return\s+([^;]+?)\s*;")
+    WHITESPACE_RUN = re.compile(r"\s{2,}|[^\S ]")
 
     def __init__(self):
         self.inferencer = BirdTypeInferencer()
 
     def extract_return_values(self, function_body: str) -> List[str]:
         matches = self.RETURN_PATTERN.findall(function_body)
-        return [" ".join(match.strip().split()) for match in matches]
+        # 无需替换时 sub 直接返回原字符串，不产生新的分配
+        return [self.WHITESPACE_RUN.sub(" ", match) for match in matches]
 
-    def _add_return_type(self, lines: List[str], inferred_type: str) -> List[str]:
-        result = []
-        func_header = lines[0]
-        remaining = lines[1:] if len(lines) > 1 else []
+    def _add_return_type(self, function_content: str, inferred_type: str) -> str:
+        # 只改写第一行，函数体其余部分原样拼接
+        func_header, newline, remaining = function_content.partition("\n")
+        brace = func_header.find("{")
 
-        if "{" in func_header:
-            parts = func_header.split("{", 1)
-            result.append(f"{parts[0].rstrip()} -> {inferred_type} {{{parts[1]}")
-            result.extend(remaining)
+        if brace >= 0:
+            head, tail = func_header[:brace].rstrip(), func_header[brace:]
+            func_header = f"{head} -> {inferred_type} {tail}"
         else:
             # Add type directly to function header
-            result.append(f"{func_header.rstrip()} -> {inferred_type}")
-            result.extend(remaining)
+            func_header = f"{func_header.rstrip()} -> {inferred_type}"
 
-        return result
+        return func_header + newline + remaining
 
     def process_content(self, content: str) -> str:
-        lines = content.split("\n")
-        processed_lines = []
-        function_lines = []
-        in_function = False
+        parts = []
+        last = 0
+        func_start = None
         brace_count = 0
-
-        for line in lines:
-            if self.FUNCTION_START.match(line) and not in_function:
-                in_function = True
-                function_lines = [line]
-                brace_count = line.count("{") - line.count("}")
-
-                if brace_count == 0 and "{" in line and "}" in line:
-                    processed_function = self._process_function_lines(function_lines)
-                    processed_lines.extend(processed_function)
-                    in_function = False
-                    function_lines = []
-
-            elif in_function:
-                function_lines.append(line)
-                brace_count += line.count("{") - line.count("}")
-
+        typed = False
+
+        for token in _TOKEN_RE.finditer(content):
+            if func_start is None:
+                if token.group("header"):
+                    func_start = token.start()
+                    # 函数头换行时 { 会作为单独的记号出现
+                    if token.group("open"):
+                        brace_count = 1
+                        typed = "->" in token.group("header")
+                    else:
+                        brace_count = 0
+                continue
+
+            text = token.group()
+            if text == "{":
                 if brace_count == 0:
-                    processed_function = self._process_function_lines(function_lines)
-                    processed_lines.extend(processed_function)
-                    in_function = False
-                    function_lines = []
-            else:
-                processed_lines.append(line)
-
-        return "\n".join(processed_lines)
-
-    def _process_function_lines(self, lines: List[str]) -> List[str]:
-        if not lines:
-            return lines
+                    # 多行函数头：检查到 { 为止的全部内容
+                    typed = "->" in content[func_start : token.start()]
+                brace_count += 1
+            elif text == "}":
+                brace_count -= 1
+                if brace_count == 0:
+                    func_end = token.end()
+                    # 已声明返回类型的函数无需再分析函数体；
+                    # 未修改的函数留在原文中，随下一段切片一并输出
+                    if not typed:
+                        function_content = content[func_start:func_end]
+                        inferred_type = self._infer_function_type(function_content)
+                        if inferred_type is not None:
+                            parts.append(content[last:func_start])
+                            parts.append(
+                                self._add_return_type(function_content, inferred_type)
+                            )
+                            last = func_end
+                    func_start = None
+
+        parts.append(content[last:])
+        return "".join(parts)
+
+    def _infer_function_type(self, function_content: str) -> Optional[str]:
+        """Return the type to add to the function, or None to leave it as is."""
+        # 无返回语句或已声明类型的函数无需提取返回值和推断类型
+        if "return" not in function_content or " -> " in function_content:
+            return None
 
-        function_content = "\n".join(lines)
         return_values = self.extract_return_values(function_content)
-        inferred_type = self.inferencer.infer_return_type(return_values)
-
-        if inferred_type is None or " -> " in function_content:
-            return lines
-
-        return self._add_return_type(lines, inferred_type)
+        return self.inferencer.infer_return_type(return_values)
 
     def process_single_function(self, function_content: str) -> str:
         """Compatibility method for existing tests."""
-        lines = function_content.split("\n")
-        processed_lines = self._process_function_lines(lines)
-        return "\n".join(processed_lines)
+        inferred_type = self._infer_function_type(function_content)
+        if inferred_type is None:
+            return function_content
+
+        return self._add_return_type(function_content, inferred_type)
 
 
 def process_file(
-    file_path: Path, in_place: bool = False, lang_config: LanguageConfig = None
+    file_path: Path,
+    in_place: bool = False,
+    lang_config: LanguageConfig = None,
+    processor: Optional[BirdConfigProcessor] = None,
 ) -> str:
-    processor = BirdConfigProcessor()
+    if processor is None:
+        processor = BirdConfigProcessor()
 
-    encodings = ["utf-8", "latin-1"]
-    for encoding in encodings:
-        try:
-            with open(file_path, "r", encoding=encoding) as f:
-                content = f.read()
-            break
-        except UnicodeDecodeError:
-            continue
-    else:
-        raise ValueError(f"Cannot decode file {file_path}")
+    # 只读取一次，UTF-8 解码失败时对已读入的数据回退到 Latin-1
+    data = file_path.read_bytes()
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        content = data.decode("latin-1")
+
+    # 与文本模式读取一致，统一换行符
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
     processed_content = processor.process_content(content)
 
@@ -301,14 +397,18 @@ def process_file(
 
 
 def process_path(
-    path: Union[str, Path], in_place: bool = False, lang_config: LanguageConfig = None
+    path: Union[str, Path],
+    in_place: bool = False,
+    lang_config: LanguageConfig = None,
+    jobs: int = 1,
 ) -> str:
     path_obj = Path(path)
 
     if path_obj.is_file():
         return process_file(path_obj, in_place, lang_config)
     elif path_obj.is_dir():
-        conf_files = list(path_obj.glob("*.conf")) + list(path_obj.glob("**/*.conf"))
+        # rglob 已包含顶层文件，排序使输出顺序稳定
+        conf_files = sorted(set(path_obj.rglob("*.conf")))
 
         if not conf_files:
             return (
@@ -317,23 +417,44 @@ def process_path(
                 else f"No .conf files found in directory {path}"
             )
 
+        # 整个目录共用一个处理器
+        worker = functools.partial(
+            process_file,
+            in_place=in_place,
+            lang_config=lang_config,
+            processor=BirdConfigProcessor(),
+        )
+        # 各文件互不依赖，多个文件时可分发到多个进程并行处理
+        if jobs > 1 and len(conf_files) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                outputs = list(executor.map(worker, conf_files))
+        else:
+            outputs = map(worker, conf_files)
+
         results = []
-        for conf_file in conf_files:
+        for conf_file, output in zip(conf_files, outputs):
             if in_place:
-                results.append(
-                    process_file(conf_file, in_place=True, lang_config=lang_config)
-                )
+                results.append(output)
             else:
-                content = process_file(
-                    conf_file, in_place=False, lang_config=lang_config
-                )
-                results.append(f"# === File: {conf_file} ===\n{content}\n")
+                results.append(f"# === File: {conf_file} ===\n{output}\n")
 
         return "\n".join(results)
     else:
         return f"Error: Path {path} does not exist"
 
 
+def _color_formatter(code: str, reset: str) -> Callable[[str], str]:
+    if not code:
+        return str
+    return lambda text: f"{code}{text}{reset}"
+
+
+def _build_color_formatters(colors: dict) -> dict:
+    return {
+        color: _color_formatter(code, colors["reset"]) for color, code in colors.items()
+    }
+
+
 class ColorFormatter:
     COLORS = (
         {
@@ -346,10 +467,12 @@ class ColorFormatter:
         if sys.stdout.isatty()
         else {key: "" for key in ["cyan", "yellow", "green", "red", "reset"]}
     )
+    # 每种颜色预先生成格式化函数，非终端输出时直接返回原文本
+    _FORMATTERS = _build_color_formatters(COLORS)
 
     @classmethod
     def format(cls, text: str, color: str) -> str:
-        return f"{cls.COLORS.get(color, '')}{text}{cls.COLORS['reset']}"
+        return cls._FORMATTERS[color](text)
 
 
 def show_usage(lang_config: LanguageConfig):
@@ -367,9 +490,14 @@ def show_usage(lang_config: LanguageConfig):
     }
 
     options = {
-        "zh": ["-i, --in-place    直接修改文件", "-h, --help        显示帮助"],
+        "zh": [
+            "-i, --in-place    直接修改文件",
+            "-j, --jobs N      使用 N 个进程批量处理目录",
+            "-h, --help        显示帮助",
+        ],
         "en": [
             "-i, --in-place    Modify files in-place",
+            "-j, --jobs N      Process directories with N worker processes",
             "-h, --help        Show help",
         ],
     }
@@ -408,6 +536,9 @@ def create_argument_parser(lang_config: LanguageConfig) -> argparse.ArgumentPars
   # 批量处理目录
   %(prog)s /path/to/configs/
 
+  # 使用 4 个进程批量处理目录
+  %(prog)s -j 4 /path/to/configs/
+
 支持类型:
   • int:     return 1;
   • pair:    return (1, 2);  →  -> pair (int, int)
@@ -431,6 +562,9 @@ Detailed examples:
   # Batch process directory
   %(prog)s /path/to/configs/
 
+  # Batch process directory with 4 worker processes
+  %(prog)s -j 4 /path/to/configs/
+
 Supported types:
   • int:     return 1;
   • pair:    return (1, 2);  →  -> pair (int, int)
@@ -459,10 +593,18 @@ Note: Void functions remain unchanged
         else "BIRD config file or directory path"
     )
     inplace_help = "直接修改文件" if lang == "zh" else "Modify files in-place"
+    jobs_help = (
+        "批量处理目录时的并行进程数 (默认: 1)"
+        if lang == "zh"
+        else "Worker processes for directories (default: 1)"
+    )
     help_help = "显示帮助" if lang == "zh" else "Show help"
 
     parser.add_argument("path", help=path_help)
     parser.add_argument("-i", "--in-place", action="store_true", help=inplace_help)
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N", help=jobs_help
+    )
     parser.add_argument("-h", "--help", action="help", help=help_help)
 
     return parser
@@ -496,7 +638,7 @@ def main():
         sys.exit(1)
 
     try:
-        result = process_path(args.path, args.in_place, lang_config)
+        result = process_path(args.path, args.in_place, lang_config, args.jobs)
 
         if args.in_place:
             print(
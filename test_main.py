@@ -144,6 +144,9 @@ class TestBirdTypeInferencer:
         
         # 混合类型应该返回能匹配所有值的类型
         (["1", "true"], "bool"),  # 'true' 不是 int，但都是 bool
+
+        # 同时匹配多个类型时按优先级选择
+        (['"a" = b'], "string"),  # 既是 string 也是 bool
     ])
     def test_infer_return_type(self, inferencer, return_values, expected):
         """测试返回类型推断"""
@@ -221,6 +224,53 @@ class TestBirdConfigProcessor:
         assert '-> int' in result
         assert '{' in result
 
+    def test_process_content_ignores_braces_in_comments_and_strings(self, processor):
+        """测试注释和字符串中的花括号不影响函数边界"""
+        content = """function test_braces()
+{
+    # closing } in a comment
+    if net ~ RTS_STATIC then return "}";
+    return "{";
+}
+
+function test_int()
+{
+    return 1;
+}"""
+
+        result = processor.process_content(content)
+        assert "function test_braces() -> string" in result
+        assert "function test_int() -> int" in result
+
+    def test_process_content_multiline_header(self, processor):
+        """测试函数头与 { 之间声明局部变量的函数"""
+        content = """function test_locals()
+bgppath P;
+{
+    return "path length: ", P.len;
+}
+# trailing comment"""
+
+        expected = """function test_locals() -> string
+bgppath P;
+{
+    return "path length: ", P.len;
+}
+# trailing comment"""
+
+        result = processor.process_content(content)
+        assert result == expected
+
+    def test_process_content_already_typed_on_next_line(self, processor):
+        """测试返回类型写在函数头下一行时不重复添加"""
+        content = """function test_prefix()
+-> prefix {
+    return 1.2.3.4/32;
+}"""
+
+        result = processor.process_content(content)
+        assert result == content
+
 
 @pytest.fixture
 def temp_test_env():
@@ -303,12 +353,28 @@ function test_already_typed() -> bool
         # 处理目录
         result = process_path(test_dir, in_place=False)
         
-        # 验证结果包含两个文件的处理结果
+        # 验证结果包含两个文件的处理结果，且每个文件只处理一次
         assert "config1.conf" in result
         assert "config2.conf" in result
+        assert result.count("=== File:") == 2
         assert "-> int" in result
         assert "-> bool" in result
-    
+
+    def test_process_directory_parallel(self, temp_test_env):
+        """测试多进程处理目录与串行结果一致"""
+        test_dir, _ = temp_test_env
+
+        for i in range(4):
+            (test_dir / f"config{i}.conf").write_text(
+                f"function test{i}() {{ return {i}; }}", encoding='utf-8'
+            )
+
+        serial = process_path(test_dir, in_place=False)
+        parallel = process_path(test_dir, in_place=False, jobs=2)
+
+        assert parallel == serial
+        assert "-> int" in parallel
+
     def test_in_place_modification(self, temp_test_env):
         """测试原地修改功能"""
         _, test_file = temp_test_env